@@ -1,4 +1,3 @@
-from utah_housing_stat386.core import get_data
 from utah_housing_stat386.cleaning import (
     get_cleaned_data,
     clean_housing_data,
@@ -7,10 +6,10 @@ from utah_housing_stat386.cleaning import (
     clean_year_built,
     clean_lot_size,
     clean_garage,
+    read_static_csv,
     remove_duplicates,
     remove_invalid_entries
 )
-from utah_housing_stat386.demo import load_demo_data, demo_cleaning, run_demo
 
 __version__ = "0.3.2"
 
@@ -23,9 +22,39 @@ __all__ = [
     "clean_year_built",
     "clean_lot_size",
     "clean_garage",
+    "read_static_csv",
     "remove_duplicates",
     "remove_invalid_entries",
     "load_demo_data",
     "demo_cleaning",
-    "run_demo"
-]
\ No newline at end of file
+    "run_demo",
+    "clear_cache",
+    "close_browser",
+    "close_http_client"
+]
+
+# The scraper pulls in crawlee/playwright and the listing cache opens a disk store,
+# so these are only imported on first use
+_LAZY_IMPORTS = {
+    "get_data": "utah_housing_stat386.core",
+    "load_demo_data": "utah_housing_stat386.demo",
+    "demo_cleaning": "utah_housing_stat386.demo",
+    "run_demo": "utah_housing_stat386.demo",
+    "clear_cache": "utah_housing_stat386._cache",
+    "close_browser": "utah_housing_stat386.core",
+    "close_http_client": "utah_housing_stat386.core",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        import importlib
+
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
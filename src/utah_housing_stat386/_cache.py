@@ -0,0 +1,54 @@
+"""
+On-disk cache of scraped listings
+
+Listing records are stored under the user cache directory keyed by the listing
+URL, so repeated scrapes skip pages fetched within the last day.
+"""
+import hashlib
+from functools import lru_cache
+
+import diskcache
+from platformdirs import user_cache_dir
+
+# Cached listings expire after one day
+CACHE_EXPIRE_SECONDS = 86400
+
+
+@lru_cache(maxsize=1)
+def _get_cache():
+    """Open the listing cache once per process."""
+    return diskcache.Cache(user_cache_dir('utah_housing_stat386'))
+
+
+def _cache_key(url):
+    """Hash a listing URL into a fixed-length cache key."""
+    return hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+
+
+def get_listing(url):
+    """
+    Look up a cached listing
+
+    Args:
+        url (str): Listing detail page URL
+
+    Returns:
+        dict or None: Cached listing record, None if missing or expired
+    """
+    return _get_cache().get(_cache_key(url))
+
+
+def set_listing(url, data):
+    """
+    Store a scraped listing
+
+    Args:
+        url (str): Listing detail page URL
+        data (dict): Listing record extracted from the page
+    """
+    _get_cache().set(_cache_key(url), data, expire=CACHE_EXPIRE_SECONDS)
+
+
+def clear_cache():
+    """Remove every cached listing."""
+    _get_cache().clear()
@@ -0,0 +1,103 @@
+"""
+Numba kernels for cleaning very large columns
+
+These mirror the vectorized pandas paths in cleaning.py but walk the raw Arrow
+UTF-8 buffers directly, so no per-row Python objects are created. Requires the
+optional numba dependency.
+"""
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from numba import njit, prange
+
+from utah_housing_stat386.cleaning import _SQFT_TO_ACRES
+
+
+@njit(cache=True)
+def _has_pair(chars, start, end, first, second):
+    """Check if the lowercased bytes in [start, end) contain the two-letter sequence."""
+    for i in range(start, end - 1):
+        if chars[i] | 0x20 == first and chars[i + 1] | 0x20 == second:
+            return True
+    return False
+
+
+@njit(cache=True)
+def _parse_lot_size(chars, start, end):
+    """Parse one lot size string into acres, NaN if there is no valid number."""
+    i = start
+    while i < end and not (48 <= chars[i] <= 57 or chars[i] == 46):
+        i += 1
+
+    mantissa = 0.0
+    decimals = 0
+    digits = 0
+    dots = 0
+    # Commas are thousands separators, skipped like the pandas path strips them
+    while i < end and (48 <= chars[i] <= 57 or chars[i] == 46 or chars[i] == 44):
+        if chars[i] == 46:
+            dots += 1
+        elif chars[i] != 44:
+            mantissa = mantissa * 10 + (chars[i] - 48)
+            digits += 1
+            if dots:
+                decimals += 1
+        i += 1
+
+    if digits == 0 or dots > 1:
+        return np.nan
+    value = mantissa / 10.0 ** decimals
+
+    # ord('a'), ord('c') / ord('s'), ord('q') / ord('f'), ord('t')
+    if _has_pair(chars, start, end, 97, 99):
+        return value
+    if _has_pair(chars, start, end, 115, 113) or _has_pair(chars, start, end, 102, 116):
+        # An acre is 43,560 sq ft
+        return value * _SQFT_TO_ACRES
+    # Assume acres if no unit specified
+    return value
+
+
+@njit(cache=True, parallel=True)
+def parse_lot_sizes(chars, offsets):
+    """
+    Parse every string of an Arrow string buffer into acres
+
+    Args:
+        chars: uint8 array with the concatenated UTF-8 bytes
+        offsets: int64 array where string i spans chars[offsets[i]:offsets[i + 1]]
+
+    Returns:
+        float64 array of lot sizes in acres
+    """
+    n = len(offsets) - 1
+    out = np.empty(n, dtype=np.float64)
+    for i in prange(n):
+        out[i] = _parse_lot_size(chars, offsets[i], offsets[i + 1])
+    return out
+
+
+def lot_sizes_to_acres(series):
+    """
+    Numba counterpart of the vectorized lot size cleaning in clean_housing_data
+
+    Args:
+        series: pandas Series with the raw lot size strings
+
+    Returns:
+        pandas Series of float64 lot sizes in acres
+    """
+    arr = pa.array(series.astype('string[pyarrow]'), type=pa.large_string())
+    if isinstance(arr, pa.ChunkedArray):
+        arr = arr.combine_chunks()
+
+    _, offsets_buf, chars_buf = arr.buffers()
+    offsets = np.frombuffer(offsets_buf, dtype=np.int64)[arr.offset:arr.offset + len(arr) + 1]
+    if chars_buf is None:
+        chars = np.empty(0, dtype=np.uint8)
+    else:
+        chars = np.frombuffer(chars_buf, dtype=np.uint8)
+
+    values = parse_lot_sizes(chars, offsets)
+    values[arr.is_null().to_numpy(zero_copy_only=False)] = np.nan
+    return pd.Series(values, index=series.index, name=series.name)
@@ -1,8 +1,34 @@
+import os
 import pandas as pd
 import re
 import numpy as np
 from datetime import datetime
 
+# Arrow-backed strings let the .str methods below run as pyarrow compute kernels
+_TEXT_DTYPE = 'string[pyarrow]'
+
+# Columns longer than this are parsed with the numba kernels when numba is available
+_NUMBA_MIN_ROWS = 50_000
+
+# Patterns shared by the scalar cleaners and the vectorized pipeline
+_PRICE_RE = re.compile(r'[$,\s]')
+_NUMERIC_RE = re.compile(r'[,\s]')
+# ASCII digits only, matching the pyarrow regex used by the vectorized path
+_LOT_NUM_RE = re.compile(r'[\d.]+', re.ASCII)
+_DIGITS_RE = re.compile(r'\d+')
+_ADDR_WS_RE = re.compile(r'\s+')
+_ADDR_COMMA_RE = re.compile(r',\s*,')
+
+# Deletion table for the common "$481,999" price shape, cheaper than a regex sub
+_PRICE_DELETE = str.maketrans('', '', '$, \t\n\r\f\v\xa0')
+
+# An acre is 43,560 sq ft; multiplying by the reciprocal avoids a division per value
+_SQFT_TO_ACRES = 1 / 43560
+
+# Valid year built range, allowing for listings of homes still under construction
+_MIN_YEAR = 1800
+_MAX_YEAR = datetime.now().year + 2
+
 
 def check_is_nan(value):
     """Check if value is NaN or empty."""
@@ -16,14 +42,24 @@ def clean_price(price_str):
     Cleaning the price to display as a numeric value instead of string.
 
     Args:
-        price_str: str - string representation of the price
+        price_str: str or pandas Series - string representation of the price
     Returns:
-        float: Numerical value of the price
+        float or pandas Series: Numerical value of the price
     """
+    if isinstance(price_str, pd.Series):
+        return _strip_to_numeric(price_str, _PRICE_RE.pattern)
+
     if check_is_nan(price_str):
         return np.nan
 
-    clean = re.sub(r'[$,\s]', '', str(price_str))
+    price_str = str(price_str)
+    try:
+        return float(price_str.translate(_PRICE_DELETE))
+    except ValueError:
+        pass
+
+    # Rarer whitespace the table doesn't cover goes through the regex
+    clean = _PRICE_RE.sub('', price_str)
     try:
         return float(clean)
     except:
@@ -35,89 +71,175 @@ def clean_numeric_field(value):
     Convert other numeric string fields to numeric values
 
     Args:
-        value (str): string value of the field
+        value (str or pandas Series): string value of the field
 
     Returns:
-        float: numeric value of the field or NaN if invalid
+        float or pandas Series: numeric value of the field or NaN if invalid
     """
+    if isinstance(value, pd.Series):
+        return _strip_to_numeric(value, _NUMERIC_RE.pattern)
+
     if check_is_nan(value):
         return np.nan
 
-    cleaned = re.sub(r'[,\s]', '', str(value))
+    cleaned = _NUMERIC_RE.sub('', str(value))
     try:
         return float(cleaned)
     except ValueError:
         return np.nan
 
 
+def _strip_to_numeric(series, pattern):
+    """
+    Vectorized counterpart of clean_price / clean_numeric_field
+
+    Args:
+        series: pandas Series with the raw field values
+        pattern: regex pattern string of the characters to strip before parsing
+
+    Returns:
+        pandas Series of float64 values, NaN where the value is invalid
+    """
+    if pd.api.types.is_numeric_dtype(series):
+        return series.astype('float64')
+
+    stripped = series.astype(_TEXT_DTYPE).str.replace(pattern, '', regex=True)
+    return pd.to_numeric(stripped, errors='coerce').astype('float64')
+
+
 def clean_year_built(year_built):
     """
     Validate and clean the year built column
 
     Args:
-        year_built: String representation of the year built
+        year_built: String representation of the year built, or a pandas Series of them
 
     Returns:
-        int: valid year built or NaN
+        int or pandas Series: valid year built or NaN
     """
+    if isinstance(year_built, pd.Series):
+        return _clean_year_built_series(year_built)
+
     if check_is_nan(year_built):
         return np.nan
 
     try:
         year = int(year_built)
-        current_year = datetime.now().year
-        if 1800 <= year <= current_year + 2:
+        if _MIN_YEAR <= year <= _MAX_YEAR:
             return year
         return np.nan
     except ValueError:
         return np.nan
 
 
+def _clean_year_built_series(series):
+    """
+    Vectorized counterpart of clean_year_built
+
+    Args:
+        series: pandas Series with the raw year built values
+
+    Returns:
+        pandas Series of float64 years, NaN where the year is invalid
+    """
+    years = _strip_to_numeric(series, r'\s')
+    valid = years.between(_MIN_YEAR, _MAX_YEAR) & (years % 1 == 0)
+    return years.where(valid)
+
+
 def clean_lot_size(lot_size_str):
     """
     Clean the lot size field to return numeric value in acres
 
     Args:
-        lot_size_str: str - string representation of the lot size
+        lot_size_str: str or pandas Series - string representation of the lot size
 
     Returns:
-        float: Numeric value of the lot size in acres
+        float or pandas Series: Numeric value of the lot size in acres
     """
+    if isinstance(lot_size_str, pd.Series):
+        return _clean_lot_size_series(lot_size_str)
+
     if check_is_nan(lot_size_str):
         return np.nan
 
-    lot_size_str = str(lot_size_str).lower().strip()
+    # Thousands separators would otherwise split "1,500 sq ft" into two numbers
+    lot_size_str = str(lot_size_str).lower().strip().replace(',', '')
+
+    # Fast path for the two shapes the site uses, "0.10 Ac" and "4356 sq ft"
+    if lot_size_str.endswith(' ac'):
+        number = lot_size_str[:-3]
+        if number.isascii() and number.replace('.', '', 1).isdigit():
+            return float(number)
+    elif lot_size_str.endswith(' sq ft'):
+        number = lot_size_str[:-6]
+        if number.isascii() and number.replace('.', '', 1).isdigit():
+            return float(number) * _SQFT_TO_ACRES
 
-    numbers = re.findall(r'[\d.]+', lot_size_str)
+    numbers = _LOT_NUM_RE.findall(lot_size_str)
     if not numbers:
         return np.nan
 
-    value = float(numbers[0])
+    try:
+        value = float(numbers[0])
+    except ValueError:
+        # Stray dots such as "1.2.3", NaN like the vectorized path
+        return np.nan
 
     if 'ac' in lot_size_str or 'acre' in lot_size_str:
         return value
     elif 'sq' in lot_size_str or 'ft' in lot_size_str:
-        # An acre is 43,560 sq ft
-        return value / 43560
+        return value * _SQFT_TO_ACRES
     else:
         # Assume acres if no unit specified
         return value
 
 
+def _clean_lot_size_series(series):
+    """
+    Vectorized counterpart of clean_lot_size
+
+    Large columns use the numba kernel when numba is installed.
+
+    Args:
+        series: pandas Series with the raw lot size strings
+
+    Returns:
+        pandas Series of float64 lot sizes in acres
+    """
+    if len(series) > _NUMBA_MIN_ROWS:
+        try:
+            from utah_housing_stat386._numeric_numba import lot_sizes_to_acres
+        except ImportError:
+            pass
+        else:
+            return lot_sizes_to_acres(series)
+
+    lots = series.astype(_TEXT_DTYPE).str.lower().str.replace(',', '', regex=False)
+    numbers = lots.str.extract(f'({_LOT_NUM_RE.pattern})', expand=False)
+    values = pd.to_numeric(numbers, errors='coerce').astype('float64')
+    # Values without a unit are assumed to be acres
+    in_sqft = ~lots.str.contains('ac', regex=False, na=False) & lots.str.contains(r'sq|ft', na=False)
+    return values.where(~in_sqft, values * _SQFT_TO_ACRES)
+
+
 def clean_garage(garage_str):
     """
     Extracting the number of garages
 
     Args:
-        garage_str: string representation of the garage
+        garage_str: string representation of the garage, or a pandas Series of them
 
     Returns:
-        int: number of garages or 0 if none/invalid
+        int or pandas Series: number of garages or 0 if none/invalid
     """
+    if isinstance(garage_str, pd.Series):
+        return _clean_garage_series(garage_str)
+
     if check_is_nan(garage_str):
         return 0
 
-    numbers = re.findall(r'\d+', str(garage_str))
+    numbers = _DIGITS_RE.findall(str(garage_str))
     if numbers:
         if int(numbers[0]) <= 15:
             return int(numbers[0])
@@ -126,41 +248,101 @@ def clean_garage(garage_str):
     return 0
 
 
+def _clean_garage_series(series):
+    """
+    Vectorized counterpart of clean_garage
+
+    Args:
+        series: pandas Series with the raw garage values
+
+    Returns:
+        pandas Series of int64 garage counts, 0 where none/invalid
+    """
+    digits = series.astype(_TEXT_DTYPE).str.extract(f'({_DIGITS_RE.pattern})', expand=False)
+    garages = pd.to_numeric(digits, errors='coerce').astype('float64')
+    return garages.where(garages <= 15, 0).astype('int64')
+
+
 def clean_address(address_str):
     """
     Standardize the address column
 
     Args:
-        address_str: String representation of the address
+        address_str: String representation of the address, or a pandas Series of them
 
     Returns:
-        str: cleaned address string
+        str or pandas Series: cleaned address string
     """
+    if isinstance(address_str, pd.Series):
+        return (
+            _as_text(address_str)
+            .str.replace(_ADDR_WS_RE.pattern, ' ', regex=True)
+            .str.replace(_ADDR_COMMA_RE.pattern, ',', regex=True)
+            .str.strip(' ,')
+        )
+
     if check_is_nan(address_str):
         return np.nan
 
-    cleaned = re.sub(r'\s+', ' ', str(address_str)).strip()
-    cleaned = re.sub(r',\s*,', ',', cleaned)
-    cleaned = cleaned.strip(',').strip()
+    cleaned = _ADDR_WS_RE.sub(' ', str(address_str))
+    cleaned = _ADDR_COMMA_RE.sub(',', cleaned)
+    cleaned = cleaned.strip(' ,')
 
     return cleaned
 
 
+def _as_text(series):
+    """Convert a Series to the string dtype, treating empty strings as missing."""
+    return series.astype(_TEXT_DTYPE).replace('', pd.NA)
+
+
 def clean_city(city_str):
     """
     Clean and standardize city names
 
     Args:
-        city_str: String representation of the city
+        city_str: String representation of the city, or a pandas Series of them
 
     Returns:
-        str: cleaned city string
+        str or pandas Series: cleaned city string
     """
+    if isinstance(city_str, pd.Series):
+        return _as_text(city_str).str.lower().str.strip()
+
     if check_is_nan(city_str):
         return np.nan
     return str(city_str).lower().strip()
 
 
+# Cleaner applied to each column by clean_housing_data; each one accepts a whole Series
+CLEANERS = {
+    'price': clean_price,
+    'beds': clean_numeric_field,
+    'baths': clean_numeric_field,
+    'sqft': clean_numeric_field,
+    'year_built': clean_year_built,
+    'lot_size': clean_lot_size,
+    'garage': clean_garage,
+    'address': clean_address,
+    'city': clean_city,
+}
+
+# Fixed compact dtypes for the cleaned numeric columns, so the result doesn't depend
+# on the values (or on Dask partition boundaries). year_built and garage are always
+# whole numbers after cleaning; beds/baths/sqft can be fractional (half baths), and
+# price keeps float64 because float32 is only exact up to 2**24
+DOWNCAST_DTYPES = {
+    'price': 'float64',
+    'beds': 'float32',
+    'baths': 'float32',
+    'sqft': 'float32',
+    'year_built': 'Int16',
+    'lot_size': 'float32',
+    'garage': 'Int16',
+    'price_per_sqft': 'float32',
+}
+
+
 def clean_housing_data(df):
     """
     Apply all cleaning functions to the dataframe
@@ -171,41 +353,50 @@ def clean_housing_data(df):
     Returns:
         pandas DataFrame with cleaned data
     """
-    df_clean = df.copy()
+    # Every column is replaced rather than modified in place, so a shallow copy is
+    # enough to leave the caller's frame untouched without copying its data
+    df_clean = df.copy(deep=False)
 
     # Drop agent column if it exists
     if 'agent' in df_clean.columns:
         df_clean = df_clean.drop(columns=['agent'])
 
-    # Clean numeric fields
-    if 'price' in df_clean.columns:
-        df_clean['price'] = df_clean['price'].apply(clean_price)
+    for col, cleaner in CLEANERS.items():
+        if col in df_clean.columns:
+            df_clean[col] = cleaner(df_clean[col])
 
-    if 'beds' in df_clean.columns:
-        df_clean['beds'] = df_clean['beds'].apply(clean_numeric_field)
+    if 'city' in df_clean.columns:
+        # Only a handful of distinct cities, so comparisons and groupbys run on category codes
+        df_clean['city'] = df_clean['city'].astype('category')
 
-    if 'baths' in df_clean.columns:
-        df_clean['baths'] = df_clean['baths'].apply(clean_numeric_field)
+    if 'price' in df_clean.columns and 'sqft' in df_clean.columns:
+        df_clean['price_per_sqft'] = df_clean['price'] / df_clean['sqft'].where(df_clean['sqft'] > 0)
 
-    if 'sqft' in df_clean.columns:
-        df_clean['sqft'] = df_clean['sqft'].apply(clean_numeric_field)
+    for col, dtype in DOWNCAST_DTYPES.items():
+        if col in df_clean.columns:
+            df_clean[col] = df_clean[col].astype(dtype)
 
-    if 'year_built' in df_clean.columns:
-        df_clean['year_built'] = df_clean['year_built'].apply(clean_year_built)
+    return df_clean
 
-    if 'lot_size' in df_clean.columns:
-        df_clean['lot_size'] = df_clean['lot_size'].apply(clean_lot_size)
 
-    if 'garage' in df_clean.columns:
-        df_clean['garage'] = df_clean['garage'].apply(clean_garage)
+def _clean_partitioned(df):
+    """
+    Apply clean_housing_data to row partitions of the dataframe in parallel with Dask
 
-    if 'address' in df_clean.columns:
-        df_clean['address'] = df_clean['address'].apply(clean_address)
+    Args:
+        df: pandas DataFrame with the raw housing data
 
-    if 'city' in df_clean.columns:
-        df_clean['city'] = df_clean['city'].apply(clean_city)
+    Returns:
+        pandas DataFrame with cleaned data
+    """
+    import dask
+    import dask.dataframe as dd
 
-    return df_clean
+    # Keep the text columns in the dtypes the pandas path returns instead of Dask's own string dtype
+    with dask.config.set({'dataframe.convert-string': False}):
+        ddf = dd.from_pandas(df, npartitions=max(2, os.cpu_count() or 1), sort=False)
+        meta = clean_housing_data(df.iloc[:0])
+        return ddf.map_partitions(clean_housing_data, meta=meta).compute(scheduler='threads')
 
 
 def remove_duplicates(df, subset=['mls']):
@@ -232,18 +423,49 @@ def remove_invalid_entries(df):
     Returns:
         pandas DataFrame: DataFrame with invalid entries removed
     """
+    return df.loc[_valid_mask(df)]
+
+
+def _valid_mask(df):
+    """Boolean mask of the rows that have all critical fields present and a positive price."""
     critical_fields = ['mls', 'price', 'address']
 
+    mask = pd.Series(True, index=df.index)
     for field in critical_fields:
         if field in df.columns:
-            df = df[df[field].notna()]
+            mask &= df[field].notna()
             if field == 'price':
-                df = df[df['price'] > 0]
+                mask &= df['price'] > 0
+
+    return mask
 
+
+def _finalize(df, subset=['mls']):
+    """
+    Remove invalid entries and duplicates in a single pass
+
+    Equivalent to remove_duplicates(remove_invalid_entries(df), subset), but the
+    duplicate check only reads the subset columns and the frame is copied once.
+    City categories left without rows are dropped as well.
+
+    Args:
+        df: Pandas DataFrame with cleaned housing data
+        subset: List of columns to check for duplicates
+
+    Returns:
+        pandas DataFrame: DataFrame with invalid entries and duplicates removed
+    """
+    mask = _valid_mask(df).to_numpy(copy=True)
+    mask[mask] = ~df.loc[mask, subset].duplicated(keep='first').to_numpy()
+    df = df.loc[mask]
+    if 'city' in df.columns and isinstance(df['city'].dtype, pd.CategoricalDtype):
+        # Cities whose rows were all dropped shouldn't linger as empty categories
+        df = df.assign(city=df['city'].cat.remove_unused_categories())
     return df
 
 
-def get_cleaned_data(max_listings=5, cities=None, output='pandas'):
+def get_cleaned_data(max_listings=5, cities=None, output='pandas', use_dask=False, max_concurrency=5,
+                     force_refresh=False):
     """
     Get housing data and apply cleaning automatically
 
@@ -251,17 +473,23 @@ def get_cleaned_data(max_listings=5, cities=None, output='pandas'):
         max_listings (int): Maximum number of listings to fetch per city
         cities (list): List of cities to scrape (None = all cities)
         output (str): 'pandas' or 'csv'
+        use_dask (bool): Clean row partitions in parallel with Dask (requires dask)
+        max_concurrency (int): Maximum number of listing pages scraped at the same time
+        force_refresh (bool): Scrape every listing again instead of using the on-disk cache
 
     Returns:
         pandas DataFrame or str: Cleaned housing data or path to saved CSV
     """
     from utah_housing_stat386.core import get_data
 
-    df_raw = get_data(max_listings=max_listings, cities=cities, output='pandas')
+    df_raw = get_data(max_listings=max_listings, cities=cities, output='pandas', max_concurrency=max_concurrency,
+                      force_refresh=force_refresh)
 
-    df_clean = clean_housing_data(df_raw)
-    df_clean = remove_invalid_entries(df_clean)
-    df_clean = remove_duplicates(df_clean)
+    if use_dask:
+        df_clean = _clean_partitioned(df_raw)
+    else:
+        df_clean = clean_housing_data(df_raw)
+    df_clean = _finalize(df_clean)
 
     if output == 'pandas':
         return df_clean
@@ -272,6 +500,36 @@ def get_cleaned_data(max_listings=5, cities=None, output='pandas'):
         raise ValueError("Invalid output option. Choose 'pandas' or 'csv'.")
 
 
+# Columns kept from the static CSVs, the scraped agent text is dropped by the cleaning anyway.
+# Scraped numeric fields are read as doubles so a stray "2.5" or blank cell doesn't fail the read
+STATIC_CSV_DTYPES = {
+    'mls': 'int64[pyarrow]',
+    'price': 'string[pyarrow]',
+    'address': 'string[pyarrow]',
+    'beds': 'double[pyarrow]',
+    'baths': 'double[pyarrow]',
+    'sqft': 'double[pyarrow]',
+    'year_built': 'double[pyarrow]',
+    'lot_size': 'string[pyarrow]',
+    'garage': 'double[pyarrow]',
+    'city': 'string[pyarrow]',
+}
+
+
+def read_static_csv(path):
+    """
+    Read one of the static housing CSVs with the multithreaded pyarrow parser
+
+    Args:
+        path (str): Local path or URL of the CSV
+
+    Returns:
+        pandas DataFrame with Arrow-backed columns
+    """
+    return pd.read_csv(path, engine='pyarrow', dtype_backend='pyarrow',
+                       usecols=list(STATIC_CSV_DTYPES), dtype=STATIC_CSV_DTYPES)
+
+
 def data_no_scape():
     """
     Get static housing data
@@ -281,20 +539,18 @@ def data_no_scape():
     """
     #df1 = pd.read_csv("../../data/utah_housing_data_ORIGINAL.csv")
     #df2 = pd.read_csv("../../data/Salt_Lake_County_housing_data.csv")
-    df1 = pd.read_csv('https://raw.githubusercontent.com/carsonordyna/Stat_386_final_project/refs/heads/main/data/utah_housing_data_ORIGINAL.csv')
-    df2 = pd.read_csv('https://raw.githubusercontent.com/carsonordyna/Stat_386_final_project/refs/heads/main/data/Salt_Lake_County_housing_data.csv')
+    df1 = read_static_csv('https://raw.githubusercontent.com/carsonordyna/Stat_386_final_project/refs/heads/main/data/utah_housing_data_ORIGINAL.csv')
+    df2 = read_static_csv('https://raw.githubusercontent.com/carsonordyna/Stat_386_final_project/refs/heads/main/data/Salt_Lake_County_housing_data.csv')
 
     return pd.concat([df1, df2])
 
 
-def cleaned_static_data():
+def cleaned_static_data(use_dask=False):
     """
     Get static housing data and apply cleaning automatically
 
     Args:
-        max_listings (int): Maximum number of listings to fetch per city
-        cities (list): List of cities to scrape (None = all cities)
-        output (str): 'pandas' or 'csv'
+        use_dask (bool): Clean row partitions in parallel with Dask (requires dask)
 
     Returns:
         pandas DataFrame or str: Cleaned housing data or path to saved CSV
@@ -303,9 +559,11 @@ def cleaned_static_data():
 
     df_raw = data_no_scape()
 
-    df_clean = clean_housing_data(df_raw)
-    df_clean = remove_invalid_entries(df_clean)
-    df_clean = remove_duplicates(df_clean)
+    if use_dask:
+        df_clean = _clean_partitioned(df_raw)
+    else:
+        df_clean = clean_housing_data(df_raw)
+    df_clean = _finalize(df_clean)
 
     return df_clean
 
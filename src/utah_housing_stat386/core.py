@@ -1,9 +1,17 @@
 import asyncio
+import atexit
+import random
 import re
+import weakref
+import httpx
 import pandas as pd
 from datetime import timedelta
+from crawlee.browsers import BrowserPool
 from crawlee.crawlers import PlaywrightCrawler, PlaywrightCrawlingContext
+from crawlee.fingerprint_suite import DefaultFingerprintGenerator, HeaderGeneratorOptions
 from crawlee import Request, ConcurrencySettings
+from selectolax.lexbor import LexborHTMLParser
+from utah_housing_stat386._cache import get_listing, set_listing
 
 # Combined city list from both scripts
 ALL_CITIES = [
@@ -16,6 +24,87 @@ ALL_CITIES = [
     "sugarhouse", "west-jordan", "west-valley"
 ]
 
+# Warm browser pools and HTTP clients, one per event loop, reused across crawls on that loop
+_BROWSER_POOLS = weakref.WeakKeyDictionary()
+_HTTP_CLIENTS = weakref.WeakKeyDictionary()
+# Event loop the synchronous get_data wrapper keeps alive between calls
+_LOOP = None
+
+async def _get_browser_pool():
+    """
+    Get the Firefox browser pool for the running event loop, launching it on first use
+
+    The pool is entered here rather than by the crawler, so crawler.run leaves it
+    open and the next crawl on the same loop skips the browser cold start.
+
+    Returns:
+        Active crawlee BrowserPool
+    """
+    loop = asyncio.get_running_loop()
+    pool = _BROWSER_POOLS.get(loop)
+    if pool is None:
+        pool = BrowserPool.with_default_plugin(
+            headless=True,
+            browser_type='firefox',
+            fingerprint_generator=DefaultFingerprintGenerator(
+                header_options=HeaderGeneratorOptions(browsers=['firefox'])
+            ),
+            # Keep the idle browser around between calls instead of retiring it
+            browser_inactive_threshold=timedelta(minutes=10),
+        )
+        await pool.__aenter__()
+        _BROWSER_POOLS[loop] = pool
+    return pool
+
+async def close_browser():
+    """Close the warm browser pool of the running event loop, if there is one."""
+    pool = _BROWSER_POOLS.pop(asyncio.get_running_loop(), None)
+    if pool is not None and pool.active:
+        await pool.__aexit__(None, None, None)
+
+def _get_http_client():
+    """
+    Get the pooled HTTP/2 client for the running event loop, creating it on first use
+
+    Returns:
+        httpx AsyncClient shared by every static page fetch on the loop
+    """
+    loop = asyncio.get_running_loop()
+    client = _HTTP_CLIENTS.get(loop)
+    if client is None:
+        client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            headers={"User-Agent": "Mozilla/5.0 (X11; Linux x86_64; rv:128.0) Gecko/20100101 Firefox/128.0"},
+            timeout=httpx.Timeout(15.0),
+            follow_redirects=True,
+        )
+        _HTTP_CLIENTS[loop] = client
+    return client
+
+async def close_http_client():
+    """Close the pooled HTTP client of the running event loop, if there is one."""
+    client = _HTTP_CLIENTS.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+def _get_loop():
+    """Get the event loop shared by get_data calls, creating it on first use."""
+    global _LOOP
+    if _LOOP is None or _LOOP.is_closed():
+        _LOOP = asyncio.new_event_loop()
+    return _LOOP
+
+@atexit.register
+def _shutdown_loop():
+    if _LOOP is None or _LOOP.is_closed():
+        return
+    try:
+        _LOOP.run_until_complete(close_http_client())
+        _LOOP.run_until_complete(close_browser())
+    finally:
+        _LOOP.close()
+
 # Utility function to safely extract text from a selector
 async def safe_text(page, selector):
     try:
@@ -33,48 +122,116 @@ def is_valid_url(url: str) -> bool:
         return False
     return not any(url.lower().startswith(p) for p in ("javascript:", "mailto:", "tel:", "#"))
 
-# Extract details from a listing page
-async def extract_detail(context: PlaywrightCrawlingContext, results):
-    page = context.page
-    url = context.request.url
-    city = context.request.user_data.get("city", "unknown")
-    mls = url.split("/listing/")[-1].split("/")[0]
-    await asyncio.sleep(1)
-
-    street = await safe_text(page, ".prop___overview h2")
-    city_state = await safe_text(page, "#location-data")
-    address = f"{street}, {city_state}".strip(" ,")
+# Selectors for the listing fields, shared by the browser and the static HTML paths
+DETAIL_SELECTORS = {
+    "street": ".prop___overview h2",
+    "city_state": "#location-data",
+    "price": ".prop-details-overview li span",
+    "beds": ".prop-details-overview li:nth-of-type(2) span",
+    "baths": ".prop-details-overview li:nth-of-type(3) span",
+    "sqft": ".prop-details-overview li:nth-of-type(4) span",
+    "agent": ".agent-name, [class*='agent']",
+}
 
-    price = await safe_text(page, ".prop-details-overview li span")
-    beds = (await safe_text(page, ".prop-details-overview li:nth-of-type(2) span")).replace(",", "")
-    baths = (await safe_text(page, ".prop-details-overview li:nth-of-type(3) span")).replace(",", "")
-    sqft = (await safe_text(page, ".prop-details-overview li:nth-of-type(4) span")).replace(",", "")
+# Build a listing record from the selector texts and the raw page HTML
+def build_listing(mls, city, texts, html):
+    address = f"{texts['street']}, {texts['city_state']}".strip(" ,")
 
-    html = await page.content()
     year_built = re.search(r"Year\s*Built[^0-9]*(\d{4})", html, re.I)
     lot_size = re.search(r"Lot[^0-9]*([\d.,]+\s*(?:ac|acre|sq\.? ft))", html, re.I)
     garage = re.search(r"Garage[^0-9]*(\d+)", html, re.I)
 
-    agent = await safe_text(page, ".agent-name, [class*='agent']")
+    agent = texts["agent"]
     agent = re.sub(r"\s+", " ", agent).strip() if agent else ""
 
-    data = {
+    return {
         "mls": mls,
-        "price": price,
+        "price": texts["price"],
         "address": address,
-        "beds": beds,
-        "baths": baths,
-        "sqft": sqft,
+        "beds": texts["beds"].replace(",", ""),
+        "baths": texts["baths"].replace(",", ""),
+        "sqft": texts["sqft"].replace(",", ""),
         "year_built": year_built.group(1) if year_built else "",
         "lot_size": lot_size.group(1) if lot_size else "",
         "garage": garage.group(1) if garage else "",
         "agent": agent,
         "city": city
     }
+
+# Cache a listing only if its page rendered, so a blank or blocked page is retried next run
+def _cache_listing(url, data):
+    if data["price"] and data["address"]:
+        set_listing(url, data)
+
+# Extract details from a listing page
+async def extract_detail(context: PlaywrightCrawlingContext, results):
+    page = context.page
+    url = context.request.url
+    city = context.request.user_data.get("city", "unknown")
+    mls = url.split("/listing/")[-1].split("/")[0]
+    # Jittered politeness delay so concurrent pages don't hit the site in lockstep
+    await asyncio.sleep(random.uniform(0.5, 1.5))
+
+    texts = {field: await safe_text(page, selector) for field, selector in DETAIL_SELECTORS.items()}
+    data = build_listing(mls, city, texts, await page.content())
+    _cache_listing(url, data)
     results.append(data)
 
-# Extract search results and queue detail pages
-async def extract_search_results(context: PlaywrightCrawlingContext, max_listings):
+# Parse a listing page fetched without a browser, None if it needs JavaScript to render
+def _parse_detail_html(html, mls, city):
+    tree = LexborHTMLParser(html)
+    if tree.css_first(".prop-details-overview") is None:
+        return None
+
+    texts = {}
+    for field, selector in DETAIL_SELECTORS.items():
+        el = tree.css_first(selector)
+        texts[field] = el.text().strip() if el else ""
+    return build_listing(mls, city, texts, html)
+
+# Seconds to wait after a 429, from the Retry-After header when it is given in seconds
+def _retry_after(response):
+    try:
+        return min(float(response.headers.get("Retry-After", 5)), 60)
+    except ValueError:
+        return 5
+
+# Fetch a page over plain HTTP, None if it could not be fetched
+async def _fetch_static(url):
+    client = _get_http_client()
+    await asyncio.sleep(random.uniform(0.5, 1.5))
+    for _ in range(3):
+        try:
+            response = await client.get(url)
+        except httpx.HTTPError:
+            return None
+        if response.status_code != 429:
+            break
+        await asyncio.sleep(_retry_after(response))
+    else:
+        return None
+    return response.text if response.status_code == 200 else None
+
+# Scrape a listing over plain HTTP, None if it has to go through the browser
+async def _scrape_static(detail_url, mls, city, limiter, static_state):
+    # A throttled request keeps its slot while it backs off, so 429s shrink the
+    # number of requests in flight until the site recovers
+    async with limiter:
+        # Once a page turns out to need JavaScript, the rest go straight to the browser
+        # instead of paying for a wasted round-trip each
+        if not static_state["enabled"]:
+            return None
+        html = await _fetch_static(detail_url)
+    data = _parse_detail_html(html, mls, city) if html else None
+    if data is None:
+        if html:
+            static_state["enabled"] = False
+        return None
+    _cache_listing(detail_url, data)
+    return data
+
+# Extract search results, returning the (url, mls, city) of listings that aren't cached
+async def extract_search_results(context: PlaywrightCrawlingContext, max_listings, results, force_refresh=False):
     page = context.page
     url = context.request.url
     match = re.search(r"utahrealestate\.com/([^/]+)-homes", url)
@@ -86,26 +243,46 @@ async def extract_search_results(context: PlaywrightCrawlingContext, max_listing
         return []
 
     cards = await page.query_selector_all(".property___card")
-    listings = []
+    pending = []
     for card in cards[:max_listings]:
         mls = await card.get_attribute("listno")
         if not mls:
             continue
         detail_url = f"https://www.utahrealestate.com/listing/{mls}"
-        listings.append(Request.from_url(detail_url, label="detail", user_data={"city": city}))
-    return listings
+        cached = None if force_refresh else get_listing(detail_url)
+        if cached is not None:
+            results.append(cached)
+            continue
+        pending.append((detail_url, mls, city))
+    return pending
 
 # Main function for PyPi package
-async def get_data_async(max_listings=5, cities=ALL_CITIES, output="pandas"):
+async def get_data_async(max_listings=5, cities=ALL_CITIES, output="pandas", max_concurrency=5, force_refresh=False):
+    try:
+        return await _scrape(max_listings, cities, output, max_concurrency, force_refresh)
+    finally:
+        # Only the loop get_data keeps alive holds on to a warm browser and HTTP client;
+        # on any other loop nothing would close them, so they go with this call
+        if asyncio.get_running_loop() is not _LOOP:
+            await close_http_client()
+            await close_browser()
+
+async def _scrape(max_listings, cities, output, max_concurrency, force_refresh):
+    if cities is None:
+        cities = ALL_CITIES
     results = []
+    pending = []
     start_urls = [f"https://www.utahrealestate.com/{c}-homes" for c in cities]
 
     crawler = PlaywrightCrawler(
-        headless=True,
-        browser_type='firefox',
+        browser_pool=await _get_browser_pool(),
         max_request_retries=2,
         max_requests_per_crawl=2000,
-        concurrency_settings=ConcurrencySettings(min_concurrency=1, max_concurrency=5, desired_concurrency=3),
+        concurrency_settings=ConcurrencySettings(
+            min_concurrency=1,
+            max_concurrency=max_concurrency,
+            desired_concurrency=min(3, max_concurrency),
+        ),
         request_handler_timeout=timedelta(seconds=60),
     )
 
@@ -114,11 +291,29 @@ async def get_data_async(max_listings=5, cities=ALL_CITIES, output="pandas"):
         if "/listing/" in context.request.url or context.request.label == "detail":
             await extract_detail(context, results)
         else:
-            new_requests = await extract_search_results(context, max_listings)
-            await context.add_requests(new_requests)
+            pending.extend(await extract_search_results(context, max_listings, results, force_refresh))
 
     await crawler.run(start_urls)
 
+    # Try the lightweight HTTP fetch for each listing first. This runs after the search
+    # pages rather than inside their handler, so throttling or a long listing list
+    # can't time out the search page and drop the city
+    limiter = asyncio.Semaphore(max_concurrency)
+    static_state = {"enabled": True}
+    scraped = await asyncio.gather(
+        *(_scrape_static(detail_url, mls, city, limiter, static_state) for detail_url, mls, city in pending)
+    )
+    results.extend(data for data in scraped if data is not None)
+
+    # Listings whose static HTML lacked the fields get a browser pass, each with its own handler timeout
+    detail_requests = [
+        Request.from_url(detail_url, label="detail", user_data={"city": city})
+        for (detail_url, _, city), data in zip(pending, scraped)
+        if data is None
+    ]
+    if detail_requests:
+        await crawler.run(detail_requests)
+
     # Output handling
     if output == "pandas":
         return pd.DataFrame(results)
@@ -130,5 +325,6 @@ async def get_data_async(max_listings=5, cities=ALL_CITIES, output="pandas"):
         raise ValueError("Invalid output option. Choose 'pandas' or 'csv'.")
 
 # Wrapper for synchronous call
-def get_data(max_listings=5, cities=ALL_CITIES, output="pandas"):
-    return asyncio.run(get_data_async(max_listings, cities, output))
\ No newline at end of file
+def get_data(max_listings=5, cities=ALL_CITIES, output="pandas", max_concurrency=5, force_refresh=False):
+    # Reuse one loop across calls so its warm browser pool survives between scrapes
+    return _get_loop().run_until_complete(get_data_async(max_listings, cities, output, max_concurrency, force_refresh))
\ No newline at end of file
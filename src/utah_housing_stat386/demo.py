@@ -1,3 +1,4 @@
+import functools
 import pandas as pd
 #import pkg_resources
 from importlib import resources as pkg_resources
@@ -7,18 +8,27 @@ def load_demo_data():
     """
     Load the demo dataset included with the package
 
+    The file is only read on the first call; later calls return a copy of the cached data.
+
     Returns:
         pandas DataFrame: Demo housing data
     """
+    return _read_demo_data().copy()
+
+
+@functools.lru_cache(maxsize=1)
+def _read_demo_data():
+    """Read the demo dataset from the package resources, falling back to GitHub."""
     try:
         # Try to load from package resources
-        data_path = pkg_resources.resource_filename('utah_housing_stat386', 'data/test_data.csv')
-        df = pd.read_csv(data_path)
+        data_path = pkg_resources.files('utah_housing_stat386') / 'data' / 'test_data.parquet'
+        with data_path.open('rb') as f:
+            df = pd.read_parquet(f, engine='pyarrow')
         return df
     except:
         # Fallback to loading from GitHub
-        url = 'https://raw.githubusercontent.com/sethfrand/Stat_386_final_project/refs/heads/main/data/test_data.csv'
-        df = pd.read_csv(url)
+        url = 'https://raw.githubusercontent.com/sethfrand/Stat_386_final_project/refs/heads/main/data/test_data.parquet'
+        df = pd.read_parquet(url, engine='pyarrow')
         return df
 
 
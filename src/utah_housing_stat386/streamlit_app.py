@@ -2,26 +2,67 @@
 
 from __future__ import annotations
 
+import os
+import tempfile
+import time
+from pathlib import Path
+
 import pandas as pd
 import streamlit as st
-import plotly.express as px
-import plotly.graph_objects as go
 
 try:
-    from cleaning import cleaned_static_data, clean_housing_data, remove_duplicates, remove_invalid_entries
+    from cleaning import (cleaned_static_data, clean_housing_data, read_static_csv, remove_duplicates,
+                          remove_invalid_entries)
 except ImportError:
     st.error("Could not import cleaning module. Make sure cleaning.py is in the same directory.")
     st.stop()
 
 
+# Cleaned static data is persisted here so a fresh server process skips the download and cleaning.
+# Bump the version whenever the cleaned columns or dtypes change so old caches are ignored.
+CACHE_VERSION = 3
+CACHE_PATH = Path(".cache") / f"clean-v{CACHE_VERSION}.parquet"
+CACHE_TTL_SECONDS = 24 * 60 * 60
+
+
+def read_cached_data():
+    """Return the cleaned data from the on-disk Parquet cache, or None if it is missing, stale or unreadable."""
+    try:
+        if time.time() - CACHE_PATH.stat().st_mtime < CACHE_TTL_SECONDS:
+            return pd.read_parquet(CACHE_PATH, engine="pyarrow")
+    except Exception:
+        # A missing or damaged cache is just a miss; the data is rebuilt from the CSVs
+        pass
+    return None
+
+
+def write_cached_data(df):
+    """Persist the cleaned data to the on-disk Parquet cache, ignoring unwritable locations."""
+    tmp_path = None
+    try:
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        # Write next to the cache and swap it in, so readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_PATH.parent, suffix=".parquet.tmp")
+        with os.fdopen(fd, "wb") as f:
+            df.to_parquet(f, engine="pyarrow")
+        os.replace(tmp_path, CACHE_PATH)
+    except OSError:
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
 @st.cache_data
 def load_static_data():
     """Load and cache the cleaned housing data."""
+    df_cached = read_cached_data()
+    if df_cached is not None:
+        return df_cached
+
     try:
         # Load directly from GitHub URLs
-        df1 = pd.read_csv(
+        df1 = read_static_csv(
             'https://raw.githubusercontent.com/carsonordyna/Stat_386_final_project/refs/heads/main/data/utah_housing_data_ORIGINAL.csv')
-        df2 = pd.read_csv(
+        df2 = read_static_csv(
             'https://raw.githubusercontent.com/carsonordyna/Stat_386_final_project/refs/heads/main/data/Salt_Lake_County_housing_data.csv')
         df_raw = pd.concat([df1, df2])
 
@@ -29,23 +70,36 @@ def load_static_data():
         df_clean = clean_housing_data(df_raw)
         df_clean = remove_invalid_entries(df_clean)
         df_clean = remove_duplicates(df_clean)
+        df_clean = drop_unused_cities(df_clean)
 
+        write_cached_data(df_clean)
         return df_clean
     except Exception as e:
         st.error(f"Error loading data: {e}")
         return None
 
 
+def drop_unused_cities(df):
+    """Drop city categories left without rows, once when the data is built, so the sidebar can list them directly."""
+    if 'city' in df.columns and isinstance(df['city'].dtype, pd.CategoricalDtype):
+        df = df.assign(city=df['city'].cat.remove_unused_categories())
+    return df
+
+
 def clean_uploaded_data(df):
     """Apply cleaning pipeline to uploaded data."""
     df_clean = clean_housing_data(df)
     df_clean = remove_invalid_entries(df_clean)
     df_clean = remove_duplicates(df_clean)
+    df_clean = drop_unused_cities(df_clean)
     return df_clean
 
 
+@st.cache_data(show_spinner=False)
 def create_price_distribution(df):
     """Create price distribution histogram."""
+    import plotly.express as px
+
     fig = px.histogram(
         df,
         x='price',
@@ -58,8 +112,11 @@ def create_price_distribution(df):
     return fig
 
 
+@st.cache_data(show_spinner=False)
 def create_price_by_city(df):
     """Create box plot of prices by city."""
+    import plotly.express as px
+
     fig = px.box(
         df,
         x='city',
@@ -71,11 +128,20 @@ def create_price_by_city(df):
     return fig
 
 
+def with_price_per_sqft(df):
+    """Add price_per_sqft for frames that didn't go through clean_housing_data (raw uploads, older CSVs)."""
+    if 'price_per_sqft' in df.columns:
+        return df
+    sqft = pd.to_numeric(df['sqft'], errors='coerce')
+    return df.assign(price_per_sqft=pd.to_numeric(df['price'], errors='coerce') / sqft.where(sqft > 0))
+
+
+@st.cache_data(show_spinner=False)
 def create_price_per_sqft_scatter(df):
     """Create scatter plot of price vs square footage."""
-    df_filtered = df.dropna(subset=['sqft', 'price'])
-    df_filtered = df_filtered[df_filtered['sqft'] > 0]
-    df_filtered['price_per_sqft'] = df_filtered['price'] / df_filtered['sqft']
+    import plotly.express as px
+
+    df_filtered = with_price_per_sqft(df).dropna(subset=['price_per_sqft'])
 
     fig = px.scatter(
         df_filtered,
@@ -84,13 +150,32 @@ def create_price_per_sqft_scatter(df):
         color='city',
         title='Price vs Square Footage',
         labels={'sqft': 'Square Feet', 'price': 'Price ($)', 'city': 'City'},
-        hover_data=['beds', 'baths', 'price_per_sqft']
+        hover_data=['beds', 'baths', 'price_per_sqft'],
+        # WebGL keeps the browser responsive with thousands of points
+        render_mode='webgl'
+    )
+    return fig
+
+
+@st.cache_data(show_spinner=False)
+def create_price_per_sqft_histogram(df, city):
+    """Create histogram of price per square foot for a single city."""
+    import plotly.express as px
+
+    fig = px.histogram(
+        df,
+        x='price_per_sqft',
+        title=f'Price per Sq Ft in {city.title()}',
+        labels={'price_per_sqft': 'Price per Sq Ft ($)'}
     )
     return fig
 
 
+@st.cache_data(show_spinner=False)
 def create_beds_baths_analysis(df):
     """Create analysis of beds and baths."""
+    import plotly.express as px
+
     df_filtered = df.dropna(subset=['beds', 'baths'])
 
     grouped = df_filtered.groupby(['beds', 'baths']).agg({
@@ -113,8 +198,11 @@ def create_beds_baths_analysis(df):
     return fig
 
 
+@st.cache_data(show_spinner=False)
 def create_year_built_analysis(df):
     """Analyze price trends by year built."""
+    import plotly.graph_objects as go
+
     df_filtered = df.dropna(subset=['year_built', 'price'])
     df_filtered = df_filtered[df_filtered['year_built'] > 1900]
 
@@ -142,6 +230,30 @@ def create_year_built_analysis(df):
     return fig
 
 
+@st.cache_data(show_spinner=False)
+def column_ranges(df):
+    """Compute the (min, max) of each slider column once per dataset, skipping columns with no data."""
+    return {
+        col: (int(df[col].min()), int(df[col].max()))
+        for col in ['price', 'beds', 'baths', 'year_built']
+        if df[col].notna().any()
+    }
+
+
+@st.cache_data(show_spinner=False)
+def apply_filters(df, selected_city, min_price, max_price, beds_range, baths_range, year_range):
+    """Filter the data by the sidebar selections, cached on the selections."""
+    mask = df['price'].between(min_price, max_price)
+    if selected_city != 'All':
+        mask &= df['city'] == selected_city
+    # Range filters only apply to columns that still have data among the selected rows
+    for col, value_range in [('beds', beds_range), ('baths', baths_range), ('year_built', year_range)]:
+        if value_range is not None and (mask & df[col].notna()).any():
+            mask &= df[col].between(*value_range)
+
+    return df.loc[mask]
+
+
 def display_summary_stats(df):
     """Display summary statistics."""
     col1, col2, col3, col4 = st.columns(4)
@@ -204,16 +316,21 @@ def main() -> None:
     # Sidebar filters (continued)
     with st.sidebar:
         # City filter
-        cities = ['All'] + sorted(df['city'].dropna().unique().tolist())
+        if isinstance(df['city'].dtype, pd.CategoricalDtype):
+            cities = ['All'] + df['city'].cat.categories.sort_values().tolist()
+        else:
+            cities = ['All'] + sorted(df['city'].dropna().unique().tolist())
         selected_city = st.selectbox("Select City", cities)
 
+        ranges = column_ranges(df)
+
         # Price range filter
-        if df['price'].notna().any():
+        if 'price' in ranges:
             min_price, max_price = st.slider(
                 "Price Range ($)",
-                min_value=int(df['price'].min()),
-                max_value=int(df['price'].max()),
-                value=(int(df['price'].min()), int(df['price'].max())),
+                min_value=ranges['price'][0],
+                max_value=ranges['price'][1],
+                value=ranges['price'],
                 format="$%d"
             )
         else:
@@ -221,21 +338,20 @@ def main() -> None:
             max_price = 1000000
 
         # Beds filter
-        if df['beds'].notna().any():
-            min_beds = int(df['beds'].min())
-            max_beds = int(df['beds'].max())
+        if 'beds' in ranges:
+            min_beds, max_beds = ranges['beds']
             beds_range = st.slider("Bedrooms", min_beds, max_beds, (min_beds, max_beds))
         else:
             beds_range = (0, 10)
         #year_build filter
-        if df['year_built'].notna().any():
-            min_year = int(df['year_built'].min())
-            max_year = int(df['year_built'].max())
+        if 'year_built' in ranges:
+            min_year, max_year = ranges['year_built']
             year_range = st.slider("Year Built", min_year, max_year, (min_year, max_year))
+        else:
+            year_range = None
         # Baths filter
-        if df['baths'].notna().any():
-            min_baths = int(df['baths'].min())
-            max_baths = int(df['baths'].max())
+        if 'baths' in ranges:
+            min_baths, max_baths = ranges['baths']
             baths_range = st.slider("Bathrooms", min_baths, max_baths, (min_baths, max_baths))
         else:
             baths_range = (0, 10)
@@ -247,28 +363,7 @@ def main() -> None:
         show_stats = st.checkbox("Show Statistical Summary", value=True)
 
     # Apply filters
-    df_filtered = df.copy()
-    if selected_city != 'All':
-        df_filtered = df_filtered[df_filtered['city'] == selected_city]
-    df_filtered = df_filtered[
-        (df_filtered['price'] >= min_price) &
-        (df_filtered['price'] <= max_price)
-        ]
-    if df_filtered['beds'].notna().any():
-        df_filtered = df_filtered[
-            (df_filtered['beds'] >= beds_range[0]) &
-            (df_filtered['beds'] <= beds_range[1])
-            ]
-    if df_filtered['baths'].notna().any():
-        df_filtered = df_filtered[
-            (df_filtered['baths'] >= baths_range[0]) &
-            (df_filtered['baths'] <= baths_range[1])
-            ]
-    if df_filtered['year_built'].notna().any():
-        df_filtered = df_filtered[
-            (df_filtered['year_built'] >= year_range[0]) &
-            (df_filtered['year_built'] <= year_range[1])
-            ]
+    df_filtered = apply_filters(df, selected_city, min_price, max_price, beds_range, baths_range, year_range)
 
     # Display data preview
     st.subheader("📋 Data Preview")
@@ -291,17 +386,9 @@ def main() -> None:
             st.plotly_chart(create_price_by_city(df_filtered), use_container_width=True)
         else:
             # Show price per sqft for single city
-            df_temp = df_filtered.dropna(subset=['sqft', 'price'])
+            df_temp = with_price_per_sqft(df_filtered).dropna(subset=['price_per_sqft'])
             if len(df_temp) > 0:
-                df_temp = df_temp[df_temp['sqft'] > 0]
-                df_temp['price_per_sqft'] = df_temp['price'] / df_temp['sqft']
-                fig = px.histogram(
-                    df_temp,
-                    x='price_per_sqft',
-                    title=f'Price per Sq Ft in {selected_city.title()}',
-                    labels={'price_per_sqft': 'Price per Sq Ft ($)'}
-                )
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(create_price_per_sqft_histogram(df_temp, selected_city), use_container_width=True)
 
     st.subheader("🏘️ Property Characteristics")
 
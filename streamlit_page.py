@@ -1,15 +1,29 @@
 import streamlit as st
 import pandas as pd
+import pyarrow as pa
+from utah_housing_stat386 import load_demo_data
 
-import streamlit as st
-import pandas as pd
 
-url = 'https://raw.githubusercontent.com/sethfrand/Stat_386_final_project/refs/heads/main/data/test_data.csv'
-df = pd.read_csv(url)
+# Rows shown in the data preview
+PREVIEW_ROWS = 200
+
+
+@st.cache_data
+def load_df():
+    """Load the demo data shipped with the package once, with integer columns downcast."""
+    df = load_demo_data()
+    for col in df.select_dtypes('integer').columns:
+        df[col] = pd.to_numeric(df[col], downcast='integer')
+    return df
+
+
+@st.cache_data
+def preview_df():
+    """Convert the first PREVIEW_ROWS rows to an Arrow table once so reruns skip serializing the frame."""
+    return pa.Table.from_pandas(load_df().head(PREVIEW_ROWS), preserve_index=False)
 
-st.title("Utah Housing Data")
 
-st.markdown("""
+INTRO_MD = """
 This application explains how to use the Utah Housing Data Package.
 
 This project is a Python package designed to collect and analyze Utah housing data from UtahRealEstate.com.
@@ -19,12 +33,10 @@ for cleaning, visualization, and analysis.
 The package web scraper uses
 [Playwright](https://github.com/oxylabs/playwright-web-scraping)
 for browser automation and easy integration into other Python projects.
-""")
+"""
 
-st.markdown("## Features")
 
-st.markdown(
-    """
+FEATURE_TABLE_MD = """
 | Feature | Description |
 |--------|------------|
 | Scraping | Scrapes housing listings for multiple cities in Utah |
@@ -39,12 +51,10 @@ st.markdown(
 | Output Format | Exports data as a Pandas DataFrame or CSV file |
 | Configurable Listings | Specify number of listings per city |
 | Target Cities | Choose which Utah cities to scrape |
-""")
-
+"""
 
-st.markdown("## Package")
 
-st.markdown("""
+PACKAGE_MD = """
 ## **Package**
 
 The main package is `utah_housing_stat386`, located in the
@@ -64,14 +74,31 @@ pip install playwright
 playwright install
 ```
 This will download the necessary browser binaries (Chromium, Firefox, WebKit) for Playwright.
-""")
-
+"""
 
 
-st.markdown("## Example")
-st.markdown("""
+EXAMPLE_MD = """
 Here is an example of how to use the package while using the the demo 
 data that is available in the package.
-""")
+"""
+
+
+st.title("Utah Housing Data")
+
+st.markdown(INTRO_MD)
+
+st.markdown("## Features")
+
+st.markdown(FEATURE_TABLE_MD)
+
+
+st.markdown("## Package")
+
+st.markdown(PACKAGE_MD)
+
+
+
+st.markdown("## Example")
+st.markdown(EXAMPLE_MD)
 
-st.dataframe(df)
\ No newline at end of file
+st.dataframe(preview_df())
\ No newline at end of file
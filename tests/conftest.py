@@ -0,0 +1,38 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+
+def _import_from_src():
+    """Import the package from the repo's src/ layout without touching sys.path"""
+    init_file = Path(__file__).resolve().parents[1] / "src" / "utah_housing_stat386" / "__init__.py"
+    spec = importlib.util.spec_from_file_location("utah_housing_stat386", init_file)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+
+
+# Checked once when pytest loads this file, before any test module imports the
+# package, so the tests also run from a checkout without an (editable) install
+if importlib.util.find_spec("utah_housing_stat386") is None:
+    _import_from_src()
+
+
+@pytest.fixture(scope="session")
+def package_imports():
+    """Import the package functions used by the tests"""
+    from utah_housing_stat386 import run_demo, load_demo_data, get_cleaned_data
+
+    return {
+        'run_demo': run_demo,
+        'load_demo_data': load_demo_data,
+        'get_cleaned_data': get_cleaned_data
+    }
+
+
+@pytest.fixture(scope="session")
+def demo_df(package_imports):
+    """Demo dataset, loaded once and shared by every test that needs it"""
+    return package_imports['load_demo_data']().copy(deep=False)
@@ -1,29 +1,6 @@
 import pytest
-import sys
-from pathlib import Path
 import pandas as pd
 
-@pytest.fixture(scope="module")
-def package_imports():
-    """Import package, handling both installed and local development scenarios"""
-    try:
-        from utah_housing_stat386 import run_demo, load_demo_data, get_cleaned_data
-    except ModuleNotFoundError:
-        # Allow running this test file directly from the repo without installing the package.
-        # Project layout uses a "src/" directory, so we add it to sys.path.
-        project_root = Path(__file__).resolve().parents[1]
-        src_dir = project_root / "src"
-        if src_dir.exists():
-            sys.path.insert(0, str(src_dir))
-
-        from utah_housing_stat386 import run_demo, load_demo_data, get_cleaned_data
-
-    return {
-        'run_demo': run_demo,
-        'load_demo_data': load_demo_data,
-        'get_cleaned_data': get_cleaned_data
-    }
-
 
 def test_imports(package_imports):
     """Test that all required functions can be imported"""
@@ -35,11 +12,9 @@ def test_imports(package_imports):
     assert callable(package_imports['get_cleaned_data'])
 
 
-def test_load_demo_data(package_imports):
+def test_load_demo_data(demo_df):
     """Test that demo data loads successfully"""
-    load_demo_data = package_imports['load_demo_data']
-
-    df = load_demo_data()
+    df = demo_df
 
     # Check that data loaded
     assert df is not None
@@ -55,11 +30,9 @@ def test_load_demo_data(package_imports):
     print(f"✓ Columns: {list(df.columns)}")
 
 
-def test_load_demo_data_content(package_imports):
+def test_load_demo_data_content(demo_df):
     """Test that demo data has valid content"""
-    load_demo_data = package_imports['load_demo_data']
-
-    df = load_demo_data()
+    df = demo_df
 
     # Check data types and content
     assert df['mls'].notna().any(), "MLS column should have data"
@@ -71,20 +44,33 @@ def test_load_demo_data_content(package_imports):
     print(df.head())
 
 
-def test_run_demo(package_imports, capsys):
+def test_run_demo(package_imports, monkeypatch):
     """Test that run_demo executes without errors"""
     run_demo = package_imports['run_demo']
 
+    # Check each printed line as it comes instead of buffering the whole output;
+    # once a line mentions data or demo, later calls skip the check entirely
+    printed = []
+    seen = []
+
+    def fake_print(*args, **kwargs):
+        printed.append(True)
+        if seen:
+            return
+        text = " ".join(map(str, args)).upper()
+        if "DEMO" in text or "DATA" in text:
+            seen.append(True)
+
+    monkeypatch.setattr("builtins.print", fake_print)
+
     # Run the demo (should not raise any exceptions)
     run_demo()
 
-    # Capture output
-    captured = capsys.readouterr()
+    monkeypatch.undo()
 
     # Check that demo produced some output
-    assert len(captured.out) > 0, "Demo should produce output"
-    assert "DEMO" in captured.out.upper() or "DATA" in captured.out.upper(), \
-        "Demo output should mention data or demo"
+    assert printed, "Demo should produce output"
+    assert seen, "Demo output should mention data or demo"
 
     print(f"\n✓ run_demo() executed successfully")
 
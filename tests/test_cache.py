@@ -0,0 +1,101 @@
+import asyncio
+from types import SimpleNamespace
+
+import diskcache
+import pytest
+
+from utah_housing_stat386 import _cache
+
+
+LISTING_URL = "https://www.utahrealestate.com/listing/2124000"
+LISTING = {"mls": "2124000", "price": "$1,599,900", "city": "sandy"}
+
+
+@pytest.fixture
+def listing_cache(tmp_path, monkeypatch):
+    """Point the listing cache at a throwaway directory"""
+    cache = diskcache.Cache(str(tmp_path))
+    monkeypatch.setattr(_cache, "_get_cache", lambda: cache)
+    yield cache
+    cache.close()
+
+
+class _FakeCard:
+    def __init__(self, mls):
+        self.mls = mls
+
+    async def get_attribute(self, name):
+        return self.mls
+
+
+class _FakePage:
+    async def wait_for_selector(self, selector, timeout=None):
+        return None
+
+    async def query_selector_all(self, selector):
+        return [_FakeCard("2124000")]
+
+
+class _FakeDetailPage:
+    """Listing page whose selectors all come back empty, like a bot wall or a page that didn't render"""
+
+    async def query_selector(self, selector):
+        return None
+
+    async def content(self):
+        return "<html><body>Checking your browser...</body></html>"
+
+
+def _detail_context():
+    return SimpleNamespace(
+        page=_FakeDetailPage(),
+        request=SimpleNamespace(url=LISTING_URL, user_data={"city": "sandy"}),
+    )
+
+
+def _search_context():
+    return SimpleNamespace(
+        page=_FakePage(),
+        request=SimpleNamespace(url="https://www.utahrealestate.com/sandy-homes"),
+    )
+
+
+def test_listing_cache_round_trip(listing_cache):
+    assert _cache.get_listing(LISTING_URL) is None
+
+    _cache.set_listing(LISTING_URL, LISTING)
+    assert _cache.get_listing(LISTING_URL) == LISTING
+
+    _cache.clear_cache()
+    assert _cache.get_listing(LISTING_URL) is None
+
+
+def test_search_results_use_cache_unless_forced(listing_cache):
+    from utah_housing_stat386.core import extract_search_results
+
+    _cache.set_listing(LISTING_URL, LISTING)
+
+    # A cached listing goes straight into the results and isn't fetched again
+    results = []
+    pending = asyncio.run(extract_search_results(_search_context(), 5, results))
+    assert results == [LISTING]
+    assert pending == []
+
+    # force_refresh skips the cache and queues the listing for scraping
+    results = []
+    pending = asyncio.run(extract_search_results(_search_context(), 5, results, force_refresh=True))
+    assert results == []
+    assert pending == [(LISTING_URL, "2124000", "sandy")]
+
+
+def test_blank_listing_page_is_not_cached(listing_cache, monkeypatch):
+    from utah_housing_stat386 import core
+
+    monkeypatch.setattr(core.random, "uniform", lambda a, b: 0)
+
+    results = []
+    asyncio.run(core.extract_detail(_detail_context(), results))
+
+    # The empty record is still returned for this run, but the next run scrapes it again
+    assert results[0]["price"] == ""
+    assert _cache.get_listing(LISTING_URL) is None
@@ -30,6 +30,7 @@ def test_clean_year_built():
 def test_clean_lot_size():
     assert clean_lot_size("0.10 Ac") == 0.10
     assert abs(clean_lot_size("4356 sq ft") - 0.1) < 0.01
+    assert abs(clean_lot_size("4,356 sq. ft") - 0.1) < 0.01
     assert pd.isna(clean_lot_size(""))
 
 
@@ -38,6 +39,34 @@ def test_clean_garage():
     assert clean_garage("") == 0
 
 
+def test_cleaners_accept_series():
+    prices = clean_price(pd.Series(["$481,999", "", None]))
+    assert prices.iloc[0] == 481999.0
+    assert prices.iloc[1:].isna().all()
+
+    assert clean_numeric_field(pd.Series(["1,252", "3"])).tolist() == [1252.0, 3.0]
+
+    years = clean_year_built(pd.Series(["1919", "1799", ""]))
+    assert years.iloc[0] == 1919
+    assert years.iloc[1:].isna().all()
+
+    lots = clean_lot_size(pd.Series(["0.10 Ac", "4356 sq ft"]))
+    assert lots.iloc[0] == 0.10
+    assert abs(lots.iloc[1] - 0.1) < 0.01
+
+    assert clean_garage(pd.Series(["2", "", None])).tolist() == [2, 0, 0]
+
+
+def test_clean_lot_size_scalar_matches_series():
+    lots = ['0.10 Ac', '4356 sq ft', '4,356 sq. ft', '2 acres', '7', '1.2.3 ac',
+            '\u00b2 ac', '\u0663 ac', '\u0663 sq ft', '', None]
+
+    scalar = pd.Series([clean_lot_size(lot) for lot in lots], dtype='float64')
+    vectorized = clean_lot_size(pd.Series(lots))
+
+    pd.testing.assert_series_equal(scalar, vectorized, check_names=False)
+
+
 def test_clean_housing_data():
     df = pd.DataFrame({
         'price': ['$100,000', '$200,000'],
@@ -49,3 +78,97 @@ def test_clean_housing_data():
 
     assert df_clean['price'].iloc[0] == 100000.0
     assert df_clean['beds'].iloc[0] == 3.0
+    assert df_clean['price'].dtype == 'float64'
+    assert df_clean['beds'].dtype == 'float32'
+
+
+def test_clean_housing_data_city_and_price_per_sqft():
+    df = pd.DataFrame({
+        'price': ['$300,000', '$450,000', '$500,000'],
+        'sqft': ['1,500', '0', ''],
+        'city': [' Provo ', 'OREM', 'provo']
+    })
+
+    df_clean = clean_housing_data(df)
+
+    assert isinstance(df_clean['city'].dtype, pd.CategoricalDtype)
+    assert df_clean['city'].tolist() == ['provo', 'orem', 'provo']
+    assert df_clean['price_per_sqft'].iloc[0] == pytest.approx(300000 / 1500)
+    # No division for zero or missing square footage
+    assert df_clean['price_per_sqft'].iloc[1:].isna().all()
+
+
+def test_finalize_drops_invalid_and_duplicate_rows():
+    from utah_housing_stat386.cleaning import _finalize, remove_duplicates, remove_invalid_entries
+
+    df = pd.DataFrame({
+        'mls': [1, 1, 2, 3, 4, 4, None],
+        'price': [100.0, 150.0, 0.0, np.nan, 200.0, 250.0, 300.0],
+        'address': ['a', 'a', 'b', 'c', None, 'd', 'e']
+    })
+
+    df_final = _finalize(df)
+
+    # Invalid rows go first, so the valid copy of MLS 4 is kept
+    assert df_final['mls'].tolist() == [1, 4]
+    assert df_final['price'].tolist() == [100.0, 250.0]
+    pd.testing.assert_frame_equal(df_final, remove_duplicates(remove_invalid_entries(df)))
+
+
+def test_finalize_drops_unused_cities():
+    from utah_housing_stat386.cleaning import _finalize
+
+    df = pd.DataFrame({
+        'mls': [1, 2],
+        'price': [100.0, 0.0],
+        'address': ['a', 'b'],
+        'city': pd.Categorical(['provo', 'orem'])
+    })
+
+    # Orem's only listing is invalid, so it shouldn't stay behind as an empty category
+    assert _finalize(df)['city'].cat.categories.tolist() == ['provo']
+
+
+def test_clean_partitioned_matches_pandas(monkeypatch):
+    pytest.importorskip("dask")
+    from utah_housing_stat386 import cleaning
+    from utah_housing_stat386.cleaning import DOWNCAST_DTYPES, _clean_partitioned, _finalize
+
+    # Several partitions even on a single-core machine, so each one sees a different set of cities
+    monkeypatch.setattr(cleaning.os, "cpu_count", lambda: 3)
+    df = pd.DataFrame({
+        'mls': ['1', '2', '3', '3', '4', '5', '6'],
+        'price': ['$300,000', '$450,000', '$525,000', '$525,000', '$0', '$610,000', '$275,000'],
+        'beds': ['3', '4', '5', '5', '2', '4', '3'],
+        'baths': ['2', '2.5', '3', '3', '1', '3', '2'],
+        'sqft': ['1,500', '2,100', '2,800', '2,800', '900', '3,000', ''],
+        'year_built': ['1995', '2004', '2018', '2018', '1978', '2021', '1962'],
+        'lot_size': ['0.20 Ac', '8,712 sq ft', '0.31 Ac', '0.31 Ac', '', '1 acre', '0.15 Ac'],
+        'garage': ['2', '2', '3', '3', '', '3', '1'],
+        'address': ['1 A St', '2 B St', '3 C St', '3 C St', '4 D St', '5 E St', '6 F St'],
+        'city': ['Provo', 'orem', 'Lehi', 'Lehi', 'Sandy', ' Provo ', 'Draper']
+    })
+
+    expected = _finalize(clean_housing_data(df))
+    result = _finalize(_clean_partitioned(df))
+
+    # Partitions can union their city categories in a different order
+    assert sorted(result['city'].cat.categories) == sorted(expected['city'].cat.categories)
+    pd.testing.assert_frame_equal(result, expected, check_categorical=False)
+    assert {col: result[col].dtype for col in DOWNCAST_DTYPES} == {
+        col: pd.api.types.pandas_dtype(dtype) for col, dtype in DOWNCAST_DTYPES.items()
+    }
+
+
+def test_lot_sizes_to_acres_matches_vectorized():
+    pytest.importorskip("numba")
+    from utah_housing_stat386._numeric_numba import lot_sizes_to_acres
+    from utah_housing_stat386.cleaning import _clean_lot_size_series
+
+    lots = pd.Series(['0.10 Ac', '4356 sq ft', '1,500 sq ft', '2 acres', '7', '1.2.3', '', None])
+
+    acres = lot_sizes_to_acres(lots)
+
+    pd.testing.assert_series_equal(acres, _clean_lot_size_series(lots))
+    assert acres.iloc[0] == 0.10
+    assert pd.isna(acres.iloc[-1])
@@ -0,0 +1,131 @@
+import asyncio
+
+import httpx
+import pytest
+
+from utah_housing_stat386 import core
+from utah_housing_stat386.core import DETAIL_SELECTORS, _parse_detail_html
+
+
+LISTING_HTML = """
+<html><body>
+  <div class="prop___overview"><h2>5 Quietwood Ln</h2></div>
+  <div id="location-data">Sandy, UT 84092</div>
+  <ul class="prop-details-overview">
+    <li><span>$1,599,900</span></li>
+    <li><span>7</span></li>
+    <li><span>6</span></li>
+    <li><span>6,154</span></li>
+  </ul>
+  <table>
+    <tr><td>Year Built</td><td>1991</td></tr>
+    <tr><td>Lot Size</td><td>0.47 Ac</td></tr>
+    <tr><td>Garage</td><td>3</td></tr>
+  </table>
+  <div class="agent-name"> Steven   R Barton </div>
+</body></html>
+"""
+
+
+def test_parse_detail_html():
+    listing = _parse_detail_html(LISTING_HTML, "2124000", "sandy")
+
+    assert listing == {
+        "mls": "2124000",
+        "price": "$1,599,900",
+        "address": "5 Quietwood Ln, Sandy, UT 84092",
+        "beds": "7",
+        "baths": "6",
+        "sqft": "6154",
+        "year_built": "1991",
+        "lot_size": "0.47 Ac",
+        "garage": "3",
+        "agent": "Steven R Barton",
+        "city": "sandy",
+    }
+    # Every selector feeds a field of the listing (street and city_state make up the address)
+    assert set(DETAIL_SELECTORS) - {"street", "city_state"} <= set(listing)
+
+
+def test_parse_detail_html_needs_browser():
+    # Without the details block the page was rendered client-side, so it goes to the browser
+    html = LISTING_HTML.replace("prop-details-overview", "placeholder")
+
+    assert _parse_detail_html(html, "2124000", "sandy") is None
+
+
+@pytest.fixture
+def fake_site(monkeypatch):
+    """Serve static fetches from a scripted list of responses and record the back-off sleeps"""
+    site = {"responses": [], "requests": [], "sleeps": []}
+
+    def handler(request):
+        site["requests"].append(str(request.url))
+        return site["responses"].pop(0)
+
+    async def fake_sleep(delay):
+        site["sleeps"].append(delay)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(core, "_get_http_client", lambda: client)
+    monkeypatch.setattr(core.asyncio, "sleep", fake_sleep)
+    monkeypatch.setattr(core.random, "uniform", lambda a, b: 0)
+    return site
+
+
+@pytest.mark.parametrize("header, expected", [
+    ({"Retry-After": "7"}, 7.0),
+    ({"Retry-After": "600"}, 60),
+    ({"Retry-After": "Wed, 21 Oct 2026 07:28:00 GMT"}, 5),
+    ({}, 5.0),
+])
+def test_retry_after(header, expected):
+    assert core._retry_after(httpx.Response(429, headers=header)) == expected
+
+
+def test_fetch_static_retries_after_429(fake_site):
+    fake_site["responses"] = [
+        httpx.Response(429, headers={"Retry-After": "120"}),
+        httpx.Response(200, text=LISTING_HTML),
+    ]
+
+    html = asyncio.run(core._fetch_static("https://example.com/listing/1"))
+
+    assert html == LISTING_HTML
+    # Politeness jitter, then the Retry-After wait capped at 60 s
+    assert fake_site["sleeps"] == [0, 60]
+
+
+def test_fetch_static_gives_up_after_three_429s(fake_site):
+    fake_site["responses"] = [httpx.Response(429) for _ in range(3)]
+
+    assert asyncio.run(core._fetch_static("https://example.com/listing/1")) is None
+    assert len(fake_site["requests"]) == 3
+
+
+def test_scrape_static_falls_back_on_error_status(fake_site):
+    fake_site["responses"] = [httpx.Response(503)]
+    static_state = {"enabled": True}
+
+    data = asyncio.run(core._scrape_static("https://example.com/listing/1", "1", "provo",
+                                           asyncio.Semaphore(1), static_state))
+
+    assert data is None
+    # A failed fetch says nothing about the page needing JavaScript
+    assert static_state["enabled"]
+
+
+def test_scrape_static_stops_after_js_page(fake_site):
+    fake_site["responses"] = [httpx.Response(200, text="<html><div id='app'></div></html>")]
+    static_state = {"enabled": True}
+
+    async def scrape_twice():
+        limiter = asyncio.Semaphore(1)
+        first = await core._scrape_static("https://example.com/listing/1", "1", "provo", limiter, static_state)
+        second = await core._scrape_static("https://example.com/listing/2", "2", "provo", limiter, static_state)
+        return first, second
+
+    assert asyncio.run(scrape_twice()) == (None, None)
+    assert not static_state["enabled"]
+    # The second listing went straight to the browser without an HTTP request
+    assert fake_site["requests"] == ["https://example.com/listing/1"]